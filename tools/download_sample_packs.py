@@ -8,19 +8,50 @@ Usage:
     python download_sample_packs.py --pack 909
     python download_sample_packs.py --pack all
     python download_sample_packs.py --list
+
+Optional: pip install "httpx[http2]" to download over HTTP/2, which
+multiplexes all parallel requests to a host over one connection.
 """
 
 import os
 import sys
 import argparse
-import urllib.request
+import http.client
+import threading
+import urllib.parse
 import ssl
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+    import httpx
+except ImportError:
+    httpx = None
 
 # Disable SSL verification for some older servers
 ssl._create_default_https_context = ssl._create_unverified_context
 
+# Maximum number of downloads in flight at once
+MAX_CONCURRENT_DOWNLOADS = 8
+
+USER_AGENT = "Mozilla/5.0 (ZicPixel Sample Downloader)"
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 64 * 1024  # Bytes per read when streaming a response to disk
+RANGED_MIN_SIZE = 512 * 1024  # Only split files larger than this with --chunks
+
+# Keep-alive connections, one per (scheme, host) for each worker thread
+_connections = threading.local()
+
+# Shared HTTP/2 client used instead of _connections when httpx is installed
+_http2_client = None
+_http2_lock = threading.Lock()
+
+# Download workers and the main thread both print; one line at a time
+_print_lock = threading.Lock()
+
 # Output directory
 SCRIPT_DIR = Path(__file__).parent.parent
 SAMPLES_DIR = SCRIPT_DIR / "data" / "audio" / "samples"
@@ -115,36 +146,311 @@ HYDROGEN_KITS = {
     "gmkit": "https://github.com/hydrogen-music/hydrogen/raw/master/data/drumkits/GMRockKit/",
 }
 
+# Flat (category, url, filename) jobs per pack, built once at import
+_PACK_JOBS: Dict[str, Tuple[Tuple[str, str, str], ...]] = {
+    pack_name: tuple(
+        (category, url, filename)
+        for category, samples in pack.items() if category != "info"
+        for url, filename in samples
+    )
+    for pack_name, pack in SAMPLE_PACKS.items()
+}
+
+
+def _log(message: str):
+    """Print a whole line without interleaving with other workers."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def _get_connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    """Return this thread's keep-alive connection to host, opening it if needed."""
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get((scheme, host))
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, timeout=30)
+        else:
+            conn = http.client.HTTPConnection(host, timeout=30)
+        pool[(scheme, host)] = conn
+    return conn
+
+
+def _close_connections():
+    """Drop this thread's connections, e.g. after a failed transfer."""
+    for conn in getattr(_connections, "pool", {}).values():
+        conn.close()
+    _connections.pool = {}
+
+
+def _get_http2_client():
+    """Return the shared HTTP/2 client, or None if httpx[http2] isn't installed."""
+    global _http2_client
+    if httpx is None:
+        return None
+    with _http2_lock:
+        if _http2_client is None:
+            _http2_client = httpx.Client(
+                http2=True,
+                timeout=30,
+                verify=False,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=4),
+                # WAVs don't compress; identity keeps Range offsets byte-exact
+                headers={"Accept-Encoding": "identity"},
+            )
+    return _http2_client
+
+
+class _Http2Response:
+    """The subset of http.client.HTTPResponse used here, over an httpx stream."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._response = stream.__enter__()
+        self._chunks = self._response.iter_bytes(CHUNK_SIZE)
+        self._buffer = b""
+        self.status = self._response.status_code
+        self.reason = self._response.reason_phrase
+        self.url = str(self._response.url)
+
+    def getheader(self, name: str, default: str = None) -> str:
+        return self._response.headers.get(name, default)
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, b"")
+            if not chunk:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def __enter__(self):
+        return self
 
-def download_file(url: str, output_path: Path) -> bool:
-    """Download a file from URL to output path."""
+    def __exit__(self, *exc_info):
+        self._stream.__exit__(*exc_info)
+
+
+def _open(url: str, method: str = "GET", headers: Dict[str, str] = None) -> http.client.HTTPResponse:
+    """Send a request over a pooled connection, following redirects.
+
+    The returned response carries the final URL in `response.url`.
+    """
+    headers = {"User-Agent": USER_AGENT, **(headers or {})}
+
+    client = _get_http2_client()
+    if client is not None:
+        response = _Http2Response(client.stream(method, url, headers=headers))
+        if response.status not in (200, 206):
+            response.__exit__(None, None, None)
+            raise OSError(f"HTTP {response.status} {response.reason}")
+        return response
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn = _get_connection(parts.scheme, parts.netloc)
+        try:
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            # The server closed the idle socket; reconnect once
+            conn.close()
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
+
+        if response.status in (301, 302, 303, 307, 308):
+            # Drain the body so the socket can be reused
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader("Location", ""))
+            continue
+        if response.status not in (200, 206):
+            response.read()
+            raise OSError(f"HTTP {response.status} {response.reason}")
+        response.url = url
+        return response
+
+    raise OSError(f"Too many redirects: {url}")
+
+
+def _needs_download(url: str, output_path: Path) -> Tuple[bool, int]:
+    """Compare a local file with the server's Content-Length.
+
+    Returns (needed, offset): offset > 0 means the local file is a
+    truncated copy that can be resumed from that byte.
+    """
     try:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Add user agent to avoid blocks
-        request = urllib.request.Request(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (ZicPixel Sample Downloader)"}
-        )
-        
-        with urllib.request.urlopen(request, timeout=30) as response:
-            with open(output_path, "wb") as f:
-                f.write(response.read())
+        size = output_path.stat().st_size
+    except FileNotFoundError:
+        return True, 0
+
+    try:
+        with _open(url, "HEAD") as response:
+            length = int(response.getheader("Content-Length") or -1)
+            accepts_ranges = response.getheader("Accept-Ranges", "") == "bytes"
+    except Exception:
+        # Can't verify right now; keep what we have
+        _close_connections()
+        return False, size
+
+    if length < 0 or size == length:
+        return False, size
+    if size < length and accepts_ranges:
+        return True, size
+    return True, 0
+
+
+def download_file(url: str, output_path: Path, offset: int = 0) -> bool:
+    """Download a file from URL to output path (its directory must exist).
+
+    With offset > 0, only the rest of the file is requested and appended
+    to what's already on disk.
+    """
+    try:
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        with _open(url, headers=headers) as response:
+            # A 200 means the server sent the whole file, so start over
+            mode = "ab" if offset and response.status == 206 else "wb"
+            if mode == "ab":
+                _log(f"  ↻ Resuming {output_path.name} from {offset} bytes")
+            # copyfileobj does its own chunking, so skip Python's write buffer
+            with open(output_path, mode, buffering=0) as f:
+                shutil.copyfileobj(response, f, length=CHUNK_SIZE)
         
         return True
     except Exception as e:
-        print(f"    Error: {e}")
+        _close_connections()
+        _log(f"    Error ({output_path.name}): {e}")
         return False
 
 
-def download_pack(pack_name: str, dry_run: bool = False) -> int:
-    """Download a sample pack."""
+def _download_range(url: str, output_path: Path, start: int, end: int) -> bool:
+    """Fetch bytes [start, end] of url into the same span of output_path.
+
+    Returns False if the server ignored the Range header.
+    """
+    with _open(url, headers={"Range": f"bytes={start}-{end}"}) as response:
+        if response.status != 206:
+            # The full body is on its way; don't reuse this socket
+            _close_connections()
+            return False
+        with open(output_path, "r+b", buffering=0) as f:
+            f.seek(start)
+            shutil.copyfileobj(response, f, length=CHUNK_SIZE)
+            received = f.tell() - start
+    if received != end - start + 1:
+        raise OSError(f"incomplete range {start}-{end} ({received} bytes)")
+    return True
+
+
+def download_file_ranged(url: str, output_path: Path, chunks: int = 4) -> bool:
+    """Download a large file as parallel HTTP Range requests.
+
+    Falls back to download_file for small files and for servers that
+    don't support ranges. The parts are written into a ".part" file that
+    only replaces output_path once every part has arrived, so an
+    interrupted run never leaves a full-size file that looks complete.
+    """
+    try:
+        with _open(url, "HEAD") as response:
+            final_url = response.url
+            size = int(response.getheader("Content-Length") or 0)
+            accepts_ranges = response.getheader("Accept-Ranges", "") == "bytes"
+    except Exception:
+        _close_connections()
+        return download_file(url, output_path)
+
+    if not accepts_ranges or size < RANGED_MIN_SIZE:
+        return download_file(url, output_path)
+
+    part_path = output_path.with_name(output_path.name + ".part")
+    try:
+        # Size the file up front so each part can write at its own offset
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+        step = -(-size // chunks)
+        spans = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+        with ThreadPoolExecutor(max_workers=len(spans)) as executor:
+            futures = [executor.submit(_download_range, final_url, part_path, a, b) for a, b in spans]
+            ranged = all(future.result() for future in futures)
+
+        if not ranged:
+            part_path.unlink()
+            return download_file(url, output_path)
+        os.replace(part_path, output_path)
+        return True
+    except Exception as e:
+        part_path.unlink(missing_ok=True)
+        _log(f"    Error ({output_path.name}): {e}")
+        return False
+
+
+def _download_all(jobs: List[Tuple[str, Path]], chunks: int = 1) -> List[Optional[bool]]:
+    """Download all (url, output_path) jobs on a bounded thread pool.
+
+    Returns one result per job: True if downloaded, False if it failed,
+    None if the file on disk was already complete. Each URL is fetched
+    once; any other paths that want the same URL get a local copy of
+    the first download.
+    """
+    def fetch(url: str, path: Path) -> Optional[bool]:
+        needed, offset = _needs_download(url, path)
+        if not needed:
+            return None
+        if offset:
+            return download_file(url, path, offset)
+        if chunks > 1:
+            return download_file_ranged(url, path, chunks)
+        return download_file(url, path)
+
+    def size(path: Path) -> int:
+        return path.stat().st_size if path.exists() else -1
+
+    by_url: Dict[str, List[Path]] = {}
+    for url, path in jobs:
+        by_url.setdefault(url, []).append(path)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+        futures = {executor.submit(fetch, url, paths[0]): paths for url, paths in by_url.items()}
+        # Report each file as it finishes rather than in submission order
+        for future in as_completed(futures):
+            paths = futures[future]
+            first = future.result()
+            for path in paths:
+                result = first
+                if path is not paths[0] and first is not False:
+                    result = None
+                    if size(path) != size(paths[0]):
+                        try:
+                            shutil.copyfile(paths[0], path)
+                            result = True
+                        except OSError as e:
+                            _log(f"    Error ({path.name}): {e}")
+                            result = False
+                mark = {True: "✓", False: "✗", None: "○"}[result]
+                _log(f"  {mark} {path.parent.parent.name}/{path.parent.name}/{path.name}")
+                results.append(result)
+    return results
+
+
+def _queue_pack(pack_name: str, dry_run: bool = False) -> Tuple[List[Tuple[str, Path]], int]:
+    """Print a pack's plan and return its (url, output_path) jobs and skip count."""
     if pack_name not in SAMPLE_PACKS:
         print(f"Unknown pack: {pack_name}")
         print(f"Available packs: {', '.join(SAMPLE_PACKS.keys())}")
-        return 0
+        return [], 0
 
-    pack = SAMPLE_PACKS[pack_name]
     pack_dir = SAMPLES_DIR / pack_name
     
     print(f"\n{'=' * 50}")
@@ -152,47 +458,78 @@ def download_pack(pack_name: str, dry_run: bool = False) -> int:
     print(f"Output: {pack_dir}")
     print(f"{'=' * 50}")
     
-    downloaded = 0
     skipped = 0
-    failed = 0
+    jobs: List[Tuple[str, Path]] = []
 
-    for category, samples in pack.items():
-        if category == "info":
-            continue
+    category_dirs: Dict[str, Path] = {}
+    have: set = set()
+
+    for category, url, filename in _PACK_JOBS[pack_name]:
+        category_dir = category_dirs.get(category)
+        if category_dir is None:
+            category_dir = category_dirs[category] = pack_dir / category
+            print(f"\n[{category.upper()}]")
             
-        category_dir = pack_dir / category
-        print(f"\n[{category.upper()}]")
-        
-        for url, filename in samples:
-            output_path = category_dir / filename
+            # Create each category once here rather than once per downloaded file
+            if not dry_run:
+                category_dir.mkdir(parents=True, exist_ok=True)
             
-            # Skip if already exists
-            if output_path.exists():
+            # One directory listing per category instead of a stat() per sample
+            have = set(os.listdir(category_dir)) if category_dir.is_dir() else set()
+        
+        output_path = category_dir / filename
+        
+        if dry_run:
+            if filename in have:
                 print(f"  ○ Skipped (exists): {filename}")
                 skipped += 1
-                continue
-            
-            if dry_run:
+            else:
                 print(f"  Would download: {filename}")
                 print(f"    From: {url}")
-                continue
-            
-            print(f"  Downloading: {filename}...", end=" ", flush=True)
-            if download_file(url, output_path):
-                print("✓")
-                downloaded += 1
-            else:
-                print("✗")
-                failed += 1
+            continue
+        
+        # Existing files are queued too, so a truncated one gets resumed
+        if filename in have:
+            print(f"  Checking: {filename}")
+        else:
+            print(f"  Queued: {filename}")
+        jobs.append((url, output_path))
+
+    return jobs, skipped
+
+
+def download_packs(pack_names: List[str], dry_run: bool = False, chunks: int = 1) -> int:
+    """Download several sample packs as one batch, fetching shared URLs once."""
+    jobs: List[Tuple[str, Path]] = []
+    skipped = 0
+    for pack_name in pack_names:
+        pack_jobs, pack_skipped = _queue_pack(pack_name, dry_run)
+        jobs.extend(pack_jobs)
+        skipped += pack_skipped
+
+    downloaded = 0
+    failed = 0
+    if jobs:
+        unique = len({url for url, _ in jobs})
+        print(f"\nFetching {unique} files ({MAX_CONCURRENT_DOWNLOADS} at a time)...")
+        results = _download_all(jobs, chunks)
+        downloaded = results.count(True)
+        failed = results.count(False)
+        skipped += results.count(None)
 
     print(f"\n{'=' * 50}")
-    print(f"Pack: {pack_name}")
+    print(f"Pack: {', '.join(pack_names)}")
     print(f"Downloaded: {downloaded}, Skipped: {skipped}, Failed: {failed}")
     print(f"{'=' * 50}")
     
     return downloaded
 
 
+def download_pack(pack_name: str, dry_run: bool = False, chunks: int = 1) -> int:
+    """Download a sample pack."""
+    return download_packs([pack_name], dry_run, chunks)
+
+
 def list_packs():
     """List available sample packs."""
     print("\n" + "=" * 50)
@@ -214,6 +551,8 @@ def list_packs():
 
 
 def main():
+    global SAMPLES_DIR
+
     parser = argparse.ArgumentParser(
         description="Download CC0/Public Domain sample packs for ZicPixel",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -224,6 +563,7 @@ Examples:
   %(prog)s --pack all         Download all available packs
   %(prog)s --list             List available packs
   %(prog)s --pack 808 --dry   Preview what would be downloaded
+  %(prog)s --pack all -c 4    Fetch large files as 4 parallel ranges
 
 No API key required! All samples are from Archive.org and public domain sources.
         """
@@ -233,11 +573,12 @@ No API key required! All samples are from Archive.org and public domain sources.
     parser.add_argument("--list", "-l", action="store_true", help="List available packs")
     parser.add_argument("--dry", "-d", action="store_true", help="Dry run - show what would be downloaded")
     parser.add_argument("--output", "-o", type=Path, help=f"Output directory (default: {SAMPLES_DIR})")
+    parser.add_argument("--chunks", "-c", type=int, default=1,
+                        help="Split large files into N parallel range requests (default: 1, off)")
     
     args = parser.parse_args()
     
     if args.output:
-        global SAMPLES_DIR
         SAMPLES_DIR = args.output
     
     if args.list:
@@ -251,13 +592,12 @@ No API key required! All samples are from Archive.org and public domain sources.
     # Create samples directory
     SAMPLES_DIR.mkdir(parents=True, exist_ok=True)
     
-    total = 0
     if args.pack.lower() == "all":
-        for pack_name in SAMPLE_PACKS:
-            if pack_name != "essentials":  # Skip meta-pack
-                total += download_pack(pack_name, args.dry)
+        # One batch across packs, so URLs shared between packs download once
+        pack_names = [p for p in SAMPLE_PACKS if p != "essentials"]  # Skip meta-pack
+        total = download_packs(pack_names, args.dry, args.chunks)
     else:
-        total = download_pack(args.pack.lower(), args.dry)
+        total = download_pack(args.pack.lower(), args.dry, args.chunks)
     
     if not args.dry:
         print(f"\n✓ Total samples downloaded: {total}")
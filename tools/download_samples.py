@@ -17,18 +17,25 @@ Usage:
 """
 
 import os
+import re
 import sys
+import gzip
 import json
 import argparse
 import urllib.request
 import urllib.parse
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Freesound API settings
 FREESOUND_API_URL = "https://freesound.org/apiv2"
 API_KEY = os.environ.get("FREESOUND_API_KEY", "")
-REQUEST_DELAY = 0.5  # Seconds between API requests to avoid rate limiting
+REQUEST_DELAY = 0.5  # Minimum seconds between API requests to avoid rate limiting
+CHUNK_SIZE = 64 * 1024  # Bytes per read when streaming a download to disk
+SEARCH_WORKERS = 5  # Parallel API searches, kept low for Freesound's rate limits
+DOWNLOAD_WORKERS = 8  # Parallel preview downloads
 
 # Output directory (relative to script or absolute)
 SCRIPT_DIR = Path(__file__).parent.parent
@@ -295,7 +302,7 @@ GENRE_PACKS = {
 }
 
 # Tags that indicate irrelevant results (false positives)
-EXCLUDE_TAGS = {
+EXCLUDE_TAGS = frozenset({
     'crowd', 'audience', 'applause', 'cheer', 'thunder', 'heartbeat',
     'speech', 'talking', 'conversation', 'voice-over', 'narration',
     'gun', 'gunshot', 'weapon', 'war', 'bomb',
@@ -307,15 +314,63 @@ EXCLUDE_TAGS = {
     'foley', 'water', 'sink', 'kitchen', 'bathroom',
     'door', 'footsteps', 'walking', 'running',
     'baby', 'child', 'laugh', 'scream', 'cry',
-}
+})
+
+# Words in a sound's name that indicate irrelevant results
+EXCLUDE_NAMES = [
+    'crowd', 'cheer', 'thunder', 'heartbeat', 'gun', 'speech',
+    'foley', 'water', 'sink', 'kitchen', 'door', 'footstep',
+    'baby', 'laugh', 'scream', 'car', 'engine', 'vehicle',
+]
+_EXCLUDE_NAME_RE = re.compile("|".join(map(re.escape, EXCLUDE_NAMES)))
 
 # Tags that indicate good drum/synth samples
-GOOD_TAGS = {
+GOOD_TAGS = frozenset({
     'drum', 'kick', 'snare', 'hihat', 'hi-hat', 'clap', 'percussion',
     'synth', 'synthesizer', 'bass', 'electronic', 'edm', 'dance',
     'house', 'techno', 'trance', '808', '909', 'tr-808', 'tr-909',
     'sample', 'one-shot', 'loop', 'beat', 'break', 'breakbeat',
-}
+})
+
+# Characters that are invalid in filenames, mapped to "_" by sanitize_filename
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+# Audio extensions stripped from sound names to avoid .wav.mp3
+_AUDIO_EXT_RE = re.compile(r"\.(wav|mp3|aiff?|flac|ogg)$", re.IGNORECASE)
+
+
+class RateLimiter:
+    """Spaces out API requests across threads, sleeping only when needed."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request slot is free."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.min_interval
+        if wait:
+            time.sleep(wait)
+
+    def backoff(self, seconds: float):
+        """Hold back every request for the given time, e.g. after a 429."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+_rate_limiter = RateLimiter(REQUEST_DELAY)
+
+# Searches and downloads print from worker threads; one line at a time
+_print_lock = threading.Lock()
+
+
+def log(message: str):
+    """Print a whole line without interleaving with other workers."""
+    with _print_lock:
+        print(message, flush=True)
 
 
 def filter_results(results: list, query: str) -> list:
@@ -332,10 +387,7 @@ def filter_results(results: list, query: str) -> list:
             continue
         
         # Skip if name contains excluded words
-        excluded_names = ['crowd', 'cheer', 'thunder', 'heartbeat', 'gun', 'speech', 
-                          'foley', 'water', 'sink', 'kitchen', 'door', 'footstep',
-                          'baby', 'laugh', 'scream', 'car', 'engine', 'vehicle']
-        if any(ex in name for ex in excluded_names):
+        if _EXCLUDE_NAME_RE.search(name):
             continue
             
         # Prefer results with good tags
@@ -377,9 +429,14 @@ def search_freesound(query: str, max_results: int = 5) -> list:
     url = f"{FREESOUND_API_URL}/search/text/?{params}"
     
     try:
-        time.sleep(REQUEST_DELAY)  # Rate limiting
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode())
+        # JSON compresses well, so ask for gzip
+        request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+        _rate_limiter.acquire()
+        with urllib.request.urlopen(request, timeout=30) as response:
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            data = json.loads(body.decode())
             results = data.get("results", [])
             
             # Filter out false positives and return top matches
@@ -388,67 +445,68 @@ def search_freesound(query: str, max_results: int = 5) -> list:
             
     except urllib.error.HTTPError as e:
         if e.code == 429:
-            print(f"  Rate limited, waiting 5 seconds...")
-            time.sleep(5)
+            # Retry-After may also be an HTTP date; only trust plain seconds
+            retry_after = e.headers.get("Retry-After", "")
+            retry_after = int(retry_after) if retry_after.isdigit() else 5
+            log(f"  Rate limited, waiting {retry_after} seconds...")
+            _rate_limiter.backoff(retry_after)
             return search_freesound(query, max_results)  # Retry
-        print(f"  HTTP Error {e.code}: {e.reason}")
+        log(f"  HTTP Error {e.code} for '{query}': {e.reason}")
         return []
     except Exception as e:
-        print(f"  Error searching: {e}")
+        log(f"  Error searching '{query}': {e}")
         return []
 
 
-def download_sound(sound_id: int, output_path: Path) -> bool:
-    """Download a sound from Freesound."""
-    time.sleep(REQUEST_DELAY)  # Rate limiting
-    
-    # First get the sound details to get preview URL
-    url = f"{FREESOUND_API_URL}/sounds/{sound_id}/?token={API_KEY}&fields=previews,name"
-    
+def download_sound(sound: dict, output_path: Path) -> bool:
+    """Download a sound's preview from Freesound.
+
+    Uses the preview URLs already returned by search_freesound, so no
+    extra API request is needed per sound. The directory of output_path
+    must already exist.
+    """
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode())
-            
         # Use HQ preview (MP3) - original requires OAuth
-        preview_url = data.get("previews", {}).get("preview-hq-mp3")
-        if not preview_url:
-            preview_url = data.get("previews", {}).get("preview-lq-mp3")
+        previews = sound.get("previews", {})
+        preview_url = previews.get("preview-hq-mp3") or previews.get("preview-lq-mp3")
         
         if not preview_url:
-            print(f"  No preview URL for sound {sound_id}")
+            log(f"  No preview URL for sound {sound['id']}")
             return False
 
-        # Download the file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
         # Change extension to mp3 for preview files
         mp3_path = output_path.with_suffix(".mp3")
         
-        urllib.request.urlretrieve(preview_url, mp3_path)
-        print(f"  ✓ Downloaded: {mp3_path.name}")
+        # Stream the preview to disk instead of buffering it in memory
+        with urllib.request.urlopen(preview_url, timeout=30) as response:
+            with open(mp3_path, "wb", buffering=0) as f:
+                while chunk := response.read(CHUNK_SIZE):
+                    f.write(chunk)
+        log(f"  ✓ Downloaded: {mp3_path.name}")
         return True
         
     except Exception as e:
-        print(f"  ✗ Failed to download {sound_id}: {e}")
+        log(f"  ✗ Failed to download {sound['id']}: {e}")
         return False
 
 
 def sanitize_filename(name: str) -> str:
     """Create a safe filename from sound name."""
     # Remove/replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, "_")
+    name = name.translate(_SANITIZE_TABLE)
     # Remove existing extensions to avoid .wav.mp3
-    for ext in ['.wav', '.mp3', '.aif', '.aiff', '.flac', '.ogg']:
-        if name.lower().endswith(ext):
-            name = name[:-len(ext)]
+    name = _AUDIO_EXT_RE.sub("", name)
     # Limit length and strip
     return name[:50].strip().replace(" ", "_")
 
 
-def download_genre_pack(genre: str, max_per_query: int = 3, dry_run: bool = False, output_dir: Path = None):
-    """Download all samples for a genre pack."""
+def download_genre_pack(genre: str, max_per_query: int = 3, dry_run: bool = False, output_dir: Path = None,
+                        force: bool = False):
+    """Download all samples for a genre pack.
+
+    Categories that already hold max_per_query MP3s per query are not
+    searched again unless force is set.
+    """
     if output_dir is None:
         output_dir = SAMPLES_DIR
         
@@ -465,15 +523,39 @@ def download_genre_pack(genre: str, max_per_query: int = 3, dry_run: bool = Fals
     print(f"Output: {genre_dir}")
     print(f"{'=' * 50}\n")
 
-    total_downloaded = 0
-    
+    # One directory listing per category instead of a stat() per sound
+    existing = {}
     for category, queries in pack.items():
         category_dir = genre_dir / category
+        have = set(os.listdir(category_dir)) if category_dir.is_dir() else set()
+        complete = sum(1 for name in have if name.endswith(".mp3"))
+        if not force and complete >= max_per_query * len(queries):
+            print(f"[{category.upper()}] already complete ({complete} files)")
+            continue
+        existing[category] = have
+        
+        # Create each category once here rather than once per downloaded file
+        if not dry_run:
+            category_dir.mkdir(parents=True, exist_ok=True)
+
+    # Run every search for the genre up front, a few at a time
+    searches = [(category, query) for category in existing for query in pack[category]]
+    if searches:
+        print(f"Searching {len(searches)} queries ({SEARCH_WORKERS} at a time)...")
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+        all_results = list(executor.map(lambda job: search_freesound(job[1], max_per_query), searches))
+    results_by_query = dict(zip(searches, all_results))
+
+    jobs = []
+    
+    for category, have in existing.items():
+        category_dir = genre_dir / category
+        queries = pack[category]
         print(f"\n[{category.upper()}]")
         
         for query in queries:
-            print(f"  Searching: '{query}'...")
-            results = search_freesound(query, max_per_query)
+            print(f"  Results for '{query}':")
+            results = results_by_query[(category, query)]
             
             if not results:
                 print(f"    No CC0 results found")
@@ -487,11 +569,24 @@ def download_genre_pack(genre: str, max_per_query: int = 3, dry_run: bool = Fals
                 filename = sanitize_filename(sound["name"])
                 output_path = category_dir / f"{filename}.wav"
                 
+                # download_sound saves the MP3 preview next to output_path
+                mp3_name = output_path.with_suffix(".mp3").name
+                if mp3_name in have:
+                    print(f"    ○ Skipped (exists): {sound['name']}")
+                    continue
+                
                 if dry_run:
                     print(f"    Would download: {sound['name']} ({sound['duration']:.1f}s)")
                 else:
-                    if download_sound(sound["id"], output_path):
-                        total_downloaded += 1
+                    print(f"    Queued: {sound['name']}")
+                    have.add(mp3_name)
+                    jobs.append((sound, output_path))
+
+    total_downloaded = 0
+    if jobs:
+        print(f"\nDownloading {len(jobs)} sounds ({DOWNLOAD_WORKERS} at a time)...")
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            total_downloaded = sum(executor.map(lambda job: download_sound(*job), jobs))
 
     print(f"\n{'=' * 50}")
     print(f"Downloaded {total_downloaded} samples for {genre}")
@@ -522,6 +617,7 @@ Examples:
   %(prog)s --all                  Download all genre packs
   %(prog)s --list                 List available genre packs
   %(prog)s --genre house --dry    Preview what would be downloaded
+  %(prog)s --genre house --force  Search again for complete categories
 
 Environment:
   FREESOUND_API_KEY   Your Freesound API key (required)
@@ -538,6 +634,8 @@ Environment:
                         help="Dry run - show what would be downloaded")
     parser.add_argument("--output", "-o", type=Path, 
                         help="Output directory (default: data/audio/samples)")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Search again even for categories that are already complete")
     
     args = parser.parse_args()
     
@@ -570,9 +668,9 @@ Environment:
     
     if args.all:
         for genre in GENRE_PACKS:
-            download_genre_pack(genre, args.max, args.dry, output_dir)
+            download_genre_pack(genre, args.max, args.dry, output_dir, args.force)
     else:
-        download_genre_pack(args.genre, args.max, args.dry, output_dir)
+        download_genre_pack(args.genre, args.max, args.dry, output_dir, args.force)
     
     print("\nDone! Samples saved to:", output_dir)
     print("\nNote: Freesound previews are MP3 format.")
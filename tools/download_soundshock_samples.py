@@ -11,585 +11,663 @@ Usage:
     python download_soundshock_samples.py --list       # List available packs
     python download_soundshock_samples.py --genre house techno  # Specific genres
     python download_soundshock_samples.py --dry        # Show what would download
+    python download_soundshock_samples.py --jobs 4     # Limit parallel downloads
+
+Optional: pip install certifi to verify TLS against its CA bundle when the
+system certificate store is missing or out of date.
 """
 
 import os
 import sys
 import argparse
+import functools
+import hashlib
+import json
+import http.client
+import urllib.parse
 import urllib.request
+import urllib.error
 import ssl
 import zipfile
+import zlib
 import shutil
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple, Optional
+
+try:
+    import certifi
+except ImportError:
+    certifi = None
 
-# Allow older SSL for compatibility
-ssl._create_default_https_context = ssl._create_unverified_context
+# One verified TLS context shared by every connection; certifi's CA bundle
+# is used when installed, otherwise the system store
+SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where() if certifi else None)
 
 SCRIPT_DIR = Path(__file__).parent.parent
 SAMPLES_DIR = SCRIPT_DIR / "data" / "audio" / "samples"
 
+# Parallel pack downloads; kept modest so SoundShock doesn't throttle us
+DEFAULT_JOBS = 8
+
+# Threads unpacking finished downloads while the next ones are fetched
+EXTRACT_WORKERS = 2
+
+# Pack ZIPs run to hundreds of MB, so stream them in large reads
+CHUNK_SIZE = 1024 * 1024
+
+# Progress is reported this often (seconds); a transfer slower than
+# STALL_RATE bytes/s for STALL_TIMEOUT seconds is dropped and retried
+PROGRESS_INTERVAL = 5.0
+STALL_RATE = 50_000
+STALL_TIMEOUT = 30.0
+
+# ZIP members smaller than this are extracted in one read instead of streamed
+SMALL_MEMBER_SIZE = 64 * 1024
+
+# Packs at least this big are fetched as RANGED_PARTS parallel Range requests
+RANGED_MIN_SIZE = 100 * 1024 * 1024
+RANGED_PARTS = 4
+
+# Per-pack URL, size, ETag and extraction state, kept in SAMPLES_DIR
+MANIFEST_NAME = ".manifest.json"
+
+# Redirect hops followed per request before giving up
+MAX_REDIRECTS = 5
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# 429 / 5xx replies are retried with exponential backoff
+MAX_RETRIES = 4
+RETRY_BASE_DELAY = 2.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Worker threads share stdout, so each line is printed under this lock
+_print_lock = threading.Lock()
+
+# Each worker thread keeps one keep-alive connection per host, so packs from
+# the same host reuse a socket (and its TLS session) instead of reconnecting
+_connections = threading.local()
+
+# Set when a run is interrupted, so transfers still in flight stop at their
+# next chunk instead of keeping the process alive until they finish
+_cancelled = threading.Event()
+
+
+def log(message: str):
+    """Print a whole line without interleaving with other workers."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+class Manifest:
+    """What was downloaded and extracted, keyed by pack URL.
+
+    Entries look like {"size": ..., "etag": ..., "extracted": bool,
+    "sha256": ...} and are written through to disk on every update so a
+    crash loses nothing.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._entries = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            self._entries = {}
+
+    def get(self, url: str) -> dict:
+        return self._entries.get(url, {})
+
+    def update(self, url: str, **fields):
+        with self._lock:
+            self._entries.setdefault(url, {}).update(fields)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so an interrupted save can't corrupt it
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(self._entries, indent=2))
+            os.replace(tmp_path, self.path)
+
+
+class Pack(NamedTuple):
+    """One downloadable sample pack."""
+    name: str
+    url: str
+    samples: int
+    size: str
+    description: str
+
+
+class Genre(NamedTuple):
+    """A genre's description and its packs."""
+    description: str
+    packs: tuple
+
+
 # =============================================================================
 # CURATED SAMPLE PACKS FROM SOUNDSHOCKAUDIO
-# Direct download links to royalty-free sample packs
+# Direct download links to royalty-free sample packs, kept in
+# soundshock_packs.json next to this script (genre -> description + packs)
 # =============================================================================
 
-SAMPLE_PACKS = {
-    # =========================================================================
-    # DRUMS - Essential drum kits for all genres
-    # =========================================================================
-    "drums": {
-        "description": "Essential drum kits - kicks, snares, hats, percussion",
-        "packs": [
-            {
-                "name": "Roland MC-505 808 Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Roland_MC-505-%20808_Kit.zip",
-                "samples": 64,
-                "size": "12.5 MB",
-                "description": "Classic 808 sounds from Roland MC-505"
-            },
-            {
-                "name": "80s Retro Futuristic Drums",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/80s--Retro-Furutistic-Drum-Pack.zip",
-                "samples": 307,
-                "size": "84 MB",
-                "description": "LinnDrum-style 80s drums, gated reverb snares"
-            },
-            {
-                "name": "Unison Essential Drum Loops",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Unison%2BEssential%2BDrum%2BLoops.zip",
-                "samples": 12,
-                "size": "19 MB",
-                "description": "Versatile drum loops for hip-hop to electronic"
-            },
-            {
-                "name": "Golden Hour Drum Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Golden-Hour-Drum-Kit.zip",
-                "samples": 165,
-                "size": "302 MB",
-                "description": "Warm punchy drums for house and chill"
-            },
-            {
-                "name": "Jazz Drum Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Jazz_Drum_Kit.zip",
-                "samples": 17,
-                "size": "724 KB",
-                "description": "Live jazz drum sounds with natural resonance"
-            },
-            {
-                "name": "Analog Supplies Vol 1",
-                "url": "https://free-sample-packs-direct-download-ssa-site.us-ord-1.linodeobjects.com/Analog_Supplies_Vol._1.zip",
-                "samples": 66,
-                "size": "190 MB",
-                "description": "Vintage hardware drum samples"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # TECHNO - Hard-hitting electronic drums and loops
-    # =========================================================================
-    "techno": {
-        "description": "Techno - Hard kicks, industrial percussion, driving beats",
-        "packs": [
-            {
-                "name": "Techno Essentials 2022",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Free-Techno-Supplements-2022-Essentials-Sample-Pack.zip",
-                "samples": 303,
-                "size": "237 MB",
-                "description": "Punchy kicks, deep bass, synth loops, pads"
-            },
-            {
-                "name": "Hard Techno Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Bluezone_Corporation_Free_Hard_Techno_Sample_Pack.zip",
-                "samples": 13,
-                "size": "24 MB",
-                "description": "Aggressive basslines, razor-sharp synths"
-            },
-            {
-                "name": "Techno Sample Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Bluezone_Corporation_Free_Techno_Sample_Pack.zip",
-                "samples": 11,
-                "size": "21 MB",
-                "description": "Punchy drums, resonant basslines"
-            },
-            {
-                "name": "Free Techno Drums",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Free-Techno-Drums.zip",
-                "samples": 102,
-                "size": "43 MB",
-                "description": "Booming kicks, crisp hats, snappy snares"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # HOUSE - 4/4 grooves, deep bass, piano stabs
-    # =========================================================================
-    "house": {
-        "description": "House - 4/4 beats, deep grooves, piano, organs",
-        "packs": [
-            {
-                "name": "House Drum Loops",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/House_Drum_Loops.zip",
-                "samples": 100,
-                "size": "102 MB",
-                "description": "Classic house rhythms, punchy kicks, crisp hats"
-            },
-            {
-                "name": "Stadium House",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Stadium-House-Samples.zip",
-                "samples": 161,
-                "size": "105 MB",
-                "description": "Anthemic sounds, soaring synths, massive bass"
-            },
-            {
-                "name": "Trends 2021",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Trends_2021.zip",
-                "samples": 319,
-                "size": "778 MB",
-                "description": "Modern house with basslines, drums, vocals"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # HIP-HOP - Boom bap, trap, 808s
-    # =========================================================================
-    "hiphop": {
-        "description": "Hip-Hop & Trap - 808s, boom bap, hard-hitting drums",
-        "packs": [
-            {
-                "name": "Murda Beatz Type Drum Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/BVKER-Butterfly-Hip-Hop-Drum-Kit.zip",
-                "samples": 94,
-                "size": "23 MB",
-                "description": "Hard-hitting drums, punchy kicks, crisp snares"
-            },
-            {
-                "name": "Nick Mira Inspired Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/wavbvkery-dreams-hip-hop-drum-kit.zip",
-                "samples": 90,
-                "size": "16 MB",
-                "description": "Punchy kicks, snappy snares, lush 808s"
-            },
-            {
-                "name": "Travis Scott Drum Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Travis-Scott-Drum-Kit.zip",
-                "samples": 115,
-                "size": "47 MB",
-                "description": "Punchy kicks, deep 808s, atmospheric loops"
-            },
-            {
-                "name": "Uzi Hip Hop Sample Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/UziHipHop-Sample-Pack.zip",
-                "samples": 90,
-                "size": "101 MB",
-                "description": "Hard drums, powerful 808s, creative FX"
-            },
-            {
-                "name": "Scott Storch Drum Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Scott_Storch_Drum_Kit.zip",
-                "samples": 688,
-                "size": "31 MB",
-                "description": "Iconic hip-hop producer sounds"
-            },
-            {
-                "name": "Dr Dre Sound Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Dr-Dre-Sound-Pack.zip",
-                "samples": 189,
-                "size": "26 MB",
-                "description": "West Coast G-Funk vibes"
-            },
-            {
-                "name": "Hip Hop and Trap Samples",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Ghosthack_-_Hip_Hop_and_Trap_Freebie.zip",
-                "samples": 50,
-                "size": "35 MB",
-                "description": "Drum kits, 808s, melodic loops"
-            },
-            {
-                "name": "Smoked Out Sound Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/smoked-out-sound-kit.zip",
-                "samples": 92,
-                "size": "4 MB",
-                "description": "Gritty raw hip-hop drums"
-            },
-            {
-                "name": "Chaos Part 1",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/CHAOS_Part_1.zip",
-                "samples": 55,
-                "size": "282 MB",
-                "description": "Heavy kicks, orchestral melodies, lofi vibes"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # DRUM & BASS - Fast breaks, heavy bass
-    # =========================================================================
-    "dnb": {
-        "description": "Drum & Bass - Fast breaks, neuro bass, jungle",
-        "packs": [
-            {
-                "name": "Experimental Breaks",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Experimental-Breaks-Samples.zip",
-                "samples": 282,
-                "size": "173 MB",
-                "description": "Unconventional drum breaks, intricate rhythms"
-            },
-            {
-                "name": "Atomic DnB Loops",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Atomic-Drum-and-Bass-Loops.zip",
-                "samples": 60,
-                "size": "68 MB",
-                "description": "High-energy drum loops, pulsating basslines"
-            },
-            {
-                "name": "Neuro DnB",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Tekvision_Neuro%20DnB.zip",
-                "samples": 48,
-                "size": "58 MB",
-                "description": "Gritty basslines, dark atmospheres"
-            },
-            {
-                "name": "Neuro Bass Tools",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Neuro_Bass_Tools.zip",
-                "samples": 20,
-                "size": "19 MB",
-                "description": "Aggressive neuro bass loops"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # AMBIENT - Pads, atmospheres, textures
-    # =========================================================================
-    "ambient": {
-        "description": "Ambient - Atmospheric pads, textures, soundscapes",
-        "packs": [
-            {
-                "name": "Atmospheric Pads Vol 1",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Berx_Atmospheric_Pads.zip",
-                "samples": 50,
-                "size": "589 MB",
-                "description": "Lush ethereal pad sounds"
-            },
-            {
-                "name": "Aurora Atmospheres Vol 1",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Euphoric-Wave-Aurora-Atmospheres-Vol-1.zip",
-                "samples": 48,
-                "size": "690 MB",
-                "description": "Lush pads, ethereal textures"
-            },
-            {
-                "name": "Ambience Sound Effects",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Ambience_Sound_Effects.zip",
-                "samples": 15,
-                "size": "96 MB",
-                "description": "Natural and urban ambient sounds"
-            },
-            {
-                "name": "Ambient Sample Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Bluezone_Corporation_Free_Ambient_Sample_Pack.zip",
-                "samples": 11,
-                "size": "97 MB",
-                "description": "Lush pads, drones, field recordings"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # GARAGE - UK Garage, 2-step
-    # =========================================================================
-    "garage": {
-        "description": "UK Garage - 2-step rhythms, shuffled beats, deep bass",
-        "packs": [
-            {
-                "name": "Dark Garage and Dubstep",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/garagedubstep_mini.zip",
-                "samples": 11,
-                "size": "17 MB",
-                "description": "Gritty textures, heavy drums"
-            },
-            {
-                "name": "Garage Sessions Vol 3",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Garage_Sessions_Vol_3.zip",
-                "samples": 238,
-                "size": "271 MB",
-                "description": "Classic UK garage, punchy drums, deep bass"
-            },
-            {
-                "name": "UK Garage Samples",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/musicradar-uk-garage-samples.zip",
-                "samples": 316,
-                "size": "165 MB",
-                "description": "Classic UK garage drums, bass, synths"
-            },
-            {
-                "name": "Emotional Garage",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/EmotionalGarage_Mini_SP.zip",
-                "samples": 10,
-                "size": "38 MB",
-                "description": "Lush pads, vocal chops, punchy drums"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # LOFI - Dusty drums, vinyl crackle, warm tones
-    # =========================================================================
-    "lofi": {
-        "description": "Lo-Fi - Dusty drums, vinyl crackle, warm nostalgic tones",
-        "packs": [
-            {
-                "name": "Daydreaming Lo-Fi StarterKit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Daydreaming-The-Ultimate-Lo-Fi-StarterKit.zip",
-                "samples": 67,
-                "size": "177 MB",
-                "description": "Dreamy textures, soft piano, vinyl samples"
-            },
-            {
-                "name": "Lunar Lo-Fi Sample Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Lunar-Lo-Fi-Sample-Pack.zip",
-                "samples": 120,
-                "size": "222 MB",
-                "description": "Warm drum loops, melancholic melodies"
-            },
-            {
-                "name": "Eternity Vintage Collection",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Eternity_Vintage_Collection.zip",
-                "samples": 467,
-                "size": "984 MB",
-                "description": "Dusty samples, vintage keys, soulful guitars"
-            },
-            {
-                "name": "Lofi Toolkit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/CymaticsLofiToolkit-V1-m2d.zip",
-                "samples": 184,
-                "size": "228 MB",
-                "description": "Crunchy drums, lush keys, soulful melodies"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # TRAP - 808s, hi-hat rolls, dark melodies
-    # =========================================================================
-    "trap": {
-        "description": "Trap - 808s, hi-hat rolls, dark melodies",
-        "packs": [
-            {
-                "name": "Free Dose Sample Loops",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/FREE.DOSE.SAMPLE.PACK.zip",
-                "samples": 276,
-                "size": "396 MB",
-                "description": "Drum loops, melodic loops, punchy 808s"
-            },
-            {
-                "name": "Trap Starter Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Trap-Starter-Pack.zip",
-                "samples": 180,
-                "size": "225 MB",
-                "description": "Powerful 808s, crisp hi-hats, melodies"
-            },
-            {
-                "name": "Trap Melody Loop Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Trap-Melody-Loop-Pack.zip",
-                "samples": 34,
-                "size": "80 MB",
-                "description": "Catchy melodies, lush pads, bells"
-            },
-            {
-                "name": "Dredhok Hybrid Trap",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Dredhok-Hybrid-Trap-Sample-Pack.zip",
-                "samples": 108,
-                "size": "59 MB",
-                "description": "Aggressive synths, earth-shattering 808s"
-            },
-            {
-                "name": "Pyrex Trap Sound Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/pyrex_trap_sound_pack.zip",
-                "samples": 237,
-                "size": "184 MB",
-                "description": "Crispy hi-hats, booming 808s, dark loops"
-            },
-        ]
-    },
-
-    # =========================================================================
-    # DUBSTEP - Heavy bass, wobbles, drops
-    # =========================================================================
-    "dubstep": {
-        "description": "Dubstep - Heavy bass, wobbles, massive drops",
-        "packs": [
-            {
-                "name": "Dubstep Pack 7",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Ghosthack_-_Dubstep_and_Trap_Pack_7.zip",
-                "samples": 60,
-                "size": "51 MB",
-                "description": "Deep bass hits, synth stabs, punchy drums"
-            },
-            {
-                "name": "Dubstep Bass Loops and Hits",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Dubstep_Bass_Loops_%26_Hits_by_Ghosthack.zip",
-                "samples": 30,
-                "size": "52 MB",
-                "description": "Growling subs, punchy mid-range basses"
-            },
-            {
-                "name": "Apashe Sample Pack",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Apashe-Sample-Pack.zip",
-                "samples": 10,
-                "size": "55 MB",
-                "description": "Cinematic bass, epic brass, intense strings"
-            },
-            {
-                "name": "Dubstep Empire Drum Kit",
-                "url": "https://downloads.soundshockaudio.com/file/VST-Plugins-On-SSA-Site/Dubstep_Empire_Drum_Kit.zip",
-                "samples": 1393,
-                "size": "128 MB",
-                "description": "Heavy drums, deep kicks, powerful claps"
-            },
-        ]
-    },
-}
-
-
-def download_file(url: str, dest_path: Path) -> bool:
-    """Download a file from URL to destination path."""
-    try:
-        print(f"  ↓ Downloading {dest_path.name}...", end=" ", flush=True)
+PACKS_FILE = Path(__file__).with_name("soundshock_packs.json")
+
+
+@functools.cache
+def load_packs() -> dict[str, Genre]:
+    """Read the pack catalogue once; later calls return the same mapping."""
+    with open(PACKS_FILE, "rb") as f:
+        data = json.load(f)
+    return {
+        genre: Genre(entry["description"], tuple(Pack(**pack) for pack in entry["packs"]))
+        for genre, entry in data.items()
+    }
+
+
+SAMPLE_PACKS = load_packs()
+
+
+def get_connection(scheme: str, host: str, timeout: float) -> http.client.HTTPConnection:
+    """Return this thread's keep-alive connection to host, opening it if needed."""
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get((scheme, host))
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, timeout=timeout, context=SSL_CONTEXT)
+        else:
+            conn = http.client.HTTPConnection(host, timeout=timeout)
+        pool[(scheme, host)] = conn
+    conn.timeout = timeout
+    return conn
+
+
+def close_connections():
+    """Drop this thread's connections, e.g. after an unfinished response."""
+    for conn in getattr(_connections, "pool", {}).values():
+        conn.close()
+    _connections.pool = {}
+
+
+def open_url(req: urllib.request.Request, timeout: float) -> http.client.HTTPResponse:
+    """Send req over this thread's pooled connection, following redirects.
+
+    Error statuses raise urllib.error.HTTPError, as urlopen() does. The
+    caller must read the body to the end (or call close_connections())
+    before the connection can carry the next request.
+    """
+    url = req.full_url
+    method = req.get_method()
+    headers = dict(req.header_items())
+    
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
         
-        req = urllib.request.Request(
-            url,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        )
+        conn = get_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            # The server closed the idle socket; reconnect once
+            conn.close()
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
         
-        with urllib.request.urlopen(req, timeout=120) as response:
-            with open(dest_path, 'wb') as f:
-                shutil.copyfileobj(response, f)
+        if response.status in (301, 302, 303, 307, 308):
+            # Drain the body so the socket can be reused
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader("Location", ""))
+            continue
+        if response.status >= 400:
+            response.read()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        return response
+    
+    raise urllib.error.URLError(f"too many redirects: {req.full_url}")
+
+
+def urlopen_with_retry(req: urllib.request.Request, timeout: float = 120):
+    """Open a request, backing off and retrying while the server is busy."""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return open_url(req, timeout)
+        except urllib.error.HTTPError as e:
+            if e.code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                raise
+            # Honour Retry-After when the server gives one in seconds
+            retry_after = e.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else RETRY_BASE_DELAY * 2 ** attempt
+            log(f"  … HTTP {e.code} for {req.full_url.split('/')[-1]}, retrying in {delay:.0f}s")
+            time.sleep(delay)
+
+
+def make_request(url: str, method: str = "GET", headers: dict = None) -> urllib.request.Request:
+    """Build a request carrying the browser User-Agent SoundShock expects."""
+    return urllib.request.Request(
+        url,
+        method=method,
+        headers={'User-Agent': USER_AGENT, **(headers or {})}
+    )
+
+
+def head(url: str) -> Optional[tuple[int, str, bool]]:
+    """Return (Content-Length, ETag, accepts Range) for url, or None on failure."""
+    try:
+        with urlopen_with_retry(make_request(url, "HEAD"), timeout=30) as response:
+            return (
+                int(response.headers.get("Content-Length") or 0),
+                response.headers.get("ETag"),
+                response.headers.get("Accept-Ranges") == "bytes",
+            )
+    except (urllib.error.URLError, OSError, ValueError, http.client.HTTPException):
+        return None
+
+
+def copy_response(response, f, label: str = "", total: int = 0, digest=None, initial: int = 0) -> int:
+    """Copy a response body into f as it arrives.
+
+    Throughput is measured every PROGRESS_INTERVAL seconds; with a label
+    it is also printed. A transfer that stays below STALL_RATE for
+    STALL_TIMEOUT seconds raises TimeoutError so the caller can retry it.
+    If digest (a hashlib object) is given, every chunk is fed to it too.
+    initial is what an earlier attempt already wrote; it only counts
+    towards the printed progress. Returns the bytes copied by this call.
+
+    read1() returns whatever has arrived (up to CHUNK_SIZE) instead of
+    blocking until a full chunk is buffered, so a slow transfer still gets
+    its stall and cancellation checks.
+    """
+    received = 0
+    window_start, window_bytes, slow_for = time.monotonic(), 0, 0.0
+    while chunk := response.read1(CHUNK_SIZE):
+        if _cancelled.is_set():
+            raise InterruptedError("cancelled")
+        f.write(chunk)
+        if digest is not None:
+            digest.update(chunk)
+        received += len(chunk)
+
+        now = time.monotonic()
+        elapsed = now - window_start
+        if elapsed >= PROGRESS_INTERVAL:
+            rate = (received - window_bytes) / elapsed
+            slow_for = slow_for + elapsed if rate < STALL_RATE else 0.0
+            if slow_for >= STALL_TIMEOUT:
+                raise TimeoutError(f"stalled below {STALL_RATE // 1000} KB/s for {slow_for:.0f}s")
+            if label:
+                done = f"{(initial + received) / 1e6:.1f}" + (f" of {total / 1e6:.1f}" if total else "")
+                log(f"    {label}: {done} MB @ {rate / 1e6:.1f} MB/s")
+            window_start, window_bytes = now, received
+    return received
+
+
+def download_range(url: str, dest_path: Path, start: int, end: int, label: str = "") -> bool:
+    """Fetch bytes start..end (inclusive) into place; False if Range was ignored."""
+    req = make_request(url, headers={'Range': f'bytes={start}-{end}'})
+    with urlopen_with_retry(req) as response:
+        if response.status != 206:
+            # The whole file is on its way; don't read it just to reuse the socket
+            close_connections()
+            return False
+        # Each part has its own handle, so the seek doesn't race the others
+        with open(dest_path, 'r+b', buffering=0) as f:
+            f.seek(start)
+            received = copy_response(response, f, label, end - start + 1)
+    if received != end - start + 1:
+        raise OSError(f"incomplete range {start}-{end} ({received} bytes)")
+    return True
+
+
+def download_ranged(url: str, dest_path: Path, length: int, name: str, parts: int = RANGED_PARTS) -> bool:
+    """Download a large file as several parallel Range requests.
+
+    Each part reports its own progress as "<name> part i/n". Returns
+    False if the server answers a part with the whole file, so the
+    caller can fall back to a single stream.
+    """
+    step = -(-length // parts)
+    spans = [(start, min(start + step, length) - 1) for start in range(0, length, step)]
+    
+    with open(dest_path, 'wb') as f:
+        f.truncate(length)
+    with ThreadPoolExecutor(max_workers=len(spans)) as executor:
+        results = list(executor.map(
+            lambda i: download_range(url, dest_path, *spans[i], f"{name} part {i + 1}/{len(spans)}"),
+            range(len(spans)),
+        ))
+    return all(results)
+
+
+def hash_file(path: Path, digest, size: int = None):
+    """Feed the first size bytes of path (all of it by default) to digest."""
+    buf = memoryview(bytearray(CHUNK_SIZE))
+    remaining = path.stat().st_size if size is None else size
+    with open(path, 'rb', buffering=0) as f:
+        while remaining and (n := f.readinto(buf[:min(remaining, CHUNK_SIZE)])):
+            digest.update(buf[:n])
+            remaining -= n
+
+
+def fetch_pack(url: str, dest_path: Path, manifest: Manifest) -> str:
+    """Download a file from URL to destination path, raising on failure.
+
+    Data goes to a ".part" file that is renamed into place when complete.
+    A ".part" left by an interrupted attempt is resumed with a Range
+    request as long as the server still reports the same ETag, and a
+    finished ZIP that was never extracted is reused as it is.
+
+    Returns the SHA-256 of the file. A single stream is hashed as it
+    comes in; a ranged download's parts land out of order, so that file
+    is read back from disk once they have all arrived. The extractor
+    records the digest once the archive has unpacked cleanly; if the same
+    ETag is fetched again, a different digest means the transfer was
+    corrupted and it is thrown away.
+    """
+    part_path = dest_path.with_name(dest_path.name + ".part")
+    
+    # Some hosts refuse HEAD; a plain GET still works
+    length, etag, accepts_ranges = head(url) or (0, None, False)
+    
+    entry = manifest.get(url)
+    same_file = etag is not None and entry.get("etag") == etag
+    expected = entry.get("sha256") if same_file else None
+    
+    # A run that died between the rename and the extraction left the whole
+    # ZIP behind; it only needs unpacking
+    if same_file and length and dest_path.exists() and dest_path.stat().st_size == length == entry.get("size"):
+        hash_file(dest_path, digest := hashlib.sha256())
+        if not expected or digest.hexdigest() == expected:
+            log(f"  ○ {dest_path.name} already downloaded")
+            return digest.hexdigest()
+        dest_path.unlink()
+    
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    resumable = accepts_ranges and 0 < offset < length and same_file
+    manifest.update(url, size=length, etag=etag, extracted=False)
+    
+    digest = hashlib.sha256()
+    ranged = not resumable and accepts_ranges and length >= RANGED_MIN_SIZE
+    if resumable:
+        log(f"  ↻ Resuming {dest_path.name} from {offset / (1024 * 1024):.1f} MB...")
+    else:
+        log(f"  ↓ Downloading {dest_path.name}...")
+        offset = 0
+    
+    # Big packs go faster as several parallel streams when Range works
+    if ranged and download_ranged(url, part_path, length, dest_path.name):
+        # Parts land out of order, so the digest is taken once they're all in
+        hash_file(part_path, digest)
+    else:
+        if ranged:
+            log(f"  … {dest_path.name}: server ignored Range, using one stream")
         
-        print("✓")
-        return True
+        headers = {'Range': f'bytes={offset}-'} if offset else None
+        with urlopen_with_retry(make_request(url, headers=headers)) as response:
+            # A 200 means the server sent the whole file after all
+            if response.status != 206:
+                offset = 0
+            elif offset:
+                # Pick the digest up from what the earlier attempt wrote
+                hash_file(part_path, digest, offset)
+            with open(part_path, 'ab' if offset else 'wb', buffering=0) as f:
+                received = offset + copy_response(response, f, dest_path.name, length, digest, offset)
         
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+        if length and received != length:
+            raise ConnectionError(f"incomplete download ({received} of {length} bytes)")
+    
+    sha256 = digest.hexdigest()
+    if expected and sha256 != expected:
+        part_path.unlink()
+        raise ConnectionError("SHA-256 mismatch, download corrupted")
+    
+    os.replace(part_path, dest_path)
+    return sha256
+
+
+def download_file(url: str, dest_path: Path, manifest: Manifest) -> Optional[str]:
+    """Download a file from URL to destination path.
+
+    Stalled or dropped transfers are retried; each retry resumes from
+    whatever the previous attempt already wrote. Returns the file's
+    SHA-256, or None if it could not be downloaded.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return fetch_pack(url, dest_path, manifest)
+        except (TimeoutError, ConnectionError, http.client.HTTPException) as e:
+            close_connections()
+            if attempt == MAX_RETRIES:
+                log(f"  ✗ {dest_path.name}: {e}")
+                return None
+            log(f"  … {dest_path.name}: {e}, retrying")
+        except Exception as e:
+            close_connections()
+            log(f"  ✗ {dest_path.name}: {e}")
+            return None
 
 
 def extract_zip(zip_path: Path, extract_to: Path) -> bool:
-    """Extract a zip file to the specified directory, skipping problematic files."""
+    """Extract a zip file to the specified directory, skipping problematic files.
+
+    A member whose data is damaged fails the whole archive instead, so a
+    corrupt download is never taken for a good one.
+    """
     try:
-        print(f"  📦 Extracting...", end=" ", flush=True)
+        log(f"  📦 Extracting {zip_path.name}...")
         
         with zipfile.ZipFile(zip_path, 'r') as zf:
-            for member in zf.namelist():
+            members = []
+            directories = set()
+            for info in zf.infolist():
+                member = info.filename
+                
                 # Skip macOS resource files that cause issues on Windows
                 if 'Icon\r' in member or member.startswith('__MACOSX') or '.DS_Store' in member:
                     continue
                 
                 # Sanitize filename for Windows
                 safe_name = member.replace('\r', '').replace(':', '-')
+                target_path = extract_to / safe_name
                 
+                if info.is_dir():
+                    directories.add(target_path)
+                else:
+                    directories.add(target_path.parent)
+                    members.append((info, target_path))
+            
+            # Create each directory once, rather than once per file in it
+            for directory in sorted(directories, key=lambda d: len(d.parts)):
                 try:
-                    # Extract to sanitized path
-                    source = zf.read(member)
-                    target_path = extract_to / safe_name
-                    
-                    if member.endswith('/'):
-                        target_path.mkdir(parents=True, exist_ok=True)
+                    directory.mkdir(parents=True, exist_ok=True)
+                except OSError:
+                    # Its files will fail below and be skipped
+                    continue
+            
+            for info, target_path in members:
+                try:
+                    if info.file_size < SMALL_MEMBER_SIZE:
+                        # Small one-shots: a single read and a single write
+                        target_path.write_bytes(zf.read(info))
                     else:
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        target_path.write_bytes(source)
-                except Exception:
-                    # Skip any problematic files
+                        # Stream the member so large WAVs never sit whole in memory
+                        with zf.open(info) as src, open(target_path, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+                except Exception as e:
+                    # Skip any problematic files, without keeping whatever
+                    # part of one was written before it failed
+                    try:
+                        target_path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                    if isinstance(e, (zipfile.BadZipFile, zlib.error, EOFError)):
+                        raise
                     continue
         
         # Remove the zip file after extraction
         zip_path.unlink()
         
-        print("✓")
         return True
         
     except Exception as e:
-        print(f"✗ Error: {e}")
+        log(f"  ✗ {zip_path.name}: {e}")
         return False
 
 
+def extractor_worker(extract_queue: queue.Queue, extracted: list, manifest: Manifest):
+    """Unpack downloaded ZIPs from the queue until a None sentinel arrives."""
+    while (item := extract_queue.get()) is not None:
+        url, zip_path, pack_dir, sha256 = item
+        if extract_zip(zip_path, pack_dir):
+            # Only a digest that unpacked cleanly is trusted for later checks
+            manifest.update(url, extracted=True, sha256=sha256)
+            extracted.append(pack_dir)
+            log(f"  ✓ {pack_dir.parent.name}/{pack_dir.name}")
+        else:
+            manifest.update(url, sha256=None)
+            if zip_path.exists():
+                # Clean up failed extraction
+                zip_path.unlink()
+
+
 def list_packs():
     """List all available sample packs."""
-    print("\n" + "=" * 60)
-    print("  AVAILABLE SAMPLE PACKS FROM SOUNDSHOCKAUDIO")
-    print("=" * 60)
+    total_packs = sum(len(data.packs) for data in SAMPLE_PACKS.values())
+    total_samples = sum(pack.samples for data in SAMPLE_PACKS.values() for pack in data.packs)
     
-    total_samples = 0
-    total_packs = 0
+    # Build the whole listing and write it at once
+    lines = [
+        "",
+        "=" * 60,
+        "  AVAILABLE SAMPLE PACKS FROM SOUNDSHOCKAUDIO",
+        "=" * 60,
+    ]
     
     for genre, data in SAMPLE_PACKS.items():
-        print(f"\n{genre.upper()}")
-        print(f"  {data['description']}")
-        print("-" * 50)
+        lines.append(f"\n{genre.upper()}")
+        lines.append(f"  {data.description}")
+        lines.append("-" * 50)
         
-        for pack in data["packs"]:
-            total_packs += 1
-            total_samples += pack["samples"]
-            print(f"  • {pack['name']}")
-            print(f"    {pack['samples']} samples, {pack['size']}")
-            print(f"    {pack['description']}")
+        for pack in data.packs:
+            lines.append(f"  • {pack.name}")
+            lines.append(f"    {pack.samples} samples, {pack.size}")
+            lines.append(f"    {pack.description}")
     
-    print("\n" + "=" * 60)
-    print(f"  TOTAL: {total_packs} packs, ~{total_samples} samples")
-    print("=" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append(f"  TOTAL: {total_packs} packs, ~{total_samples} samples")
+    lines.append("=" * 60)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def is_complete(url: str, pack_dir: Path, manifest: Manifest) -> bool:
+    """Whether pack_dir already holds an up-to-date extraction of url."""
+    entry = manifest.get(url)
+    if not entry:
+        # Extracted before the manifest existed: trust a non-empty folder
+        # unless an unfinished download is still lying in it
+        if not pack_dir.exists():
+            return False
+        names = os.listdir(pack_dir)
+        return bool(names) and not any(n.endswith((".zip", ".part")) for n in names)
+    
+    # The folder may have been deleted or emptied since it was extracted
+    if not entry.get("extracted") or not pack_dir.is_dir() or not any(pack_dir.iterdir()):
+        return False
+    
+    remote = head(url)
+    if remote is None:
+        # Can't check right now; keep what we have
+        return True
+    length, etag, _ = remote
+    return length == entry.get("size") and etag == entry.get("etag")
 
 
-def download_genre(genre: str, dry_run: bool = False) -> tuple[int, int]:
-    """Download all packs for a specific genre."""
+def queue_genre(genre: str, manifest: Manifest, dry_run: bool = False) -> tuple[list, int]:
+    """Collect the (url, zip_path, pack_dir) tasks still needed for a genre."""
     if genre not in SAMPLE_PACKS:
         print(f"Unknown genre: {genre}")
-        return 0, 0
+        return [], 0
     
     data = SAMPLE_PACKS[genre]
     genre_dir = SAMPLES_DIR / genre
     
     print(f"\n{'=' * 60}")
     print(f"  {genre.upper()}")
-    print(f"  {data['description']}")
+    print(f"  {data.description}")
     print(f"{'=' * 60}")
     
-    downloaded = 0
+    tasks = []
     skipped = 0
     
-    for pack in data["packs"]:
-        pack_name = pack["name"].replace(" ", "_").replace("/", "-")
+    for pack in data.packs:
+        pack_name = pack.name.replace(" ", "_").replace("/", "-")
         pack_dir = genre_dir / pack_name
         
         # Check if already downloaded
-        if pack_dir.exists() and any(pack_dir.iterdir()):
-            print(f"  ○ {pack['name']} (already exists)")
+        if is_complete(pack.url, pack_dir, manifest):
+            print(f"  ○ {pack.name} (already exists)")
             skipped += 1
             continue
         
         if dry_run:
-            print(f"  ? {pack['name']} - {pack['samples']} samples, {pack['size']}")
+            print(f"  ? {pack.name} - {pack.samples} samples, {pack.size}")
             continue
         
-        # Create directory and download
+        # Create directory; the download itself runs later on the pool
         pack_dir.mkdir(parents=True, exist_ok=True)
         
-        zip_filename = pack["url"].split("/")[-1]
-        zip_path = pack_dir / zip_filename
-        
-        if download_file(pack["url"], zip_path):
-            if extract_zip(zip_path, pack_dir):
-                downloaded += 1
-            else:
-                # Clean up failed extraction
-                if zip_path.exists():
-                    zip_path.unlink()
+        zip_filename = pack.url.split("/")[-1]
+        tasks.append((pack.url, pack_dir / zip_filename, pack_dir))
         
-    return downloaded, skipped
+    return tasks, skipped
+
+
+def download_all(tasks: list, manifest: Manifest, jobs: int = DEFAULT_JOBS) -> int:
+    """Download all tasks on a bounded thread pool and extract them as they land.
+
+    Extraction runs on its own threads, so unzipping one pack overlaps
+    the network fetch of the next. Returns the number of packs extracted.
+    """
+    _cancelled.clear()
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    extract_queue = queue.Queue()
+    extracted = []
+    extractors = [
+        threading.Thread(target=extractor_worker, args=(extract_queue, extracted, manifest))
+        for _ in range(EXTRACT_WORKERS)
+    ]
+    for thread in extractors:
+        thread.start()
+    
+    try:
+        futures = {
+            executor.submit(download_file, url, zip_path, manifest): (url, zip_path, pack_dir)
+            for url, zip_path, pack_dir in tasks
+        }
+        # Hand each ZIP to the extractors as soon as its download finishes
+        for future in as_completed(futures):
+            if sha256 := future.result():
+                extract_queue.put((*futures[future], sha256))
+    except BaseException:
+        # Ctrl-C or an error: abort the transfers still running
+        _cancelled.set()
+        raise
+    finally:
+        # Start no more downloads, and let the extractors finish what they
+        # have and stop, so the process can exit
+        executor.shutdown(cancel_futures=True)
+        for _ in extractors:
+            extract_queue.put(None)
+        for thread in extractors:
+            thread.join()
+    return len(extracted)
 
 
 def main():
@@ -612,8 +690,14 @@ def main():
         "--output", type=str, default=None,
         help="Output directory (default: data/audio/samples)"
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=DEFAULT_JOBS,
+        help=f"Number of packs to download in parallel (default: {DEFAULT_JOBS})"
+    )
     
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
     
     if args.output:
         global SAMPLES_DIR
@@ -634,14 +718,21 @@ def main():
     if args.dry:
         print("\n  [DRY RUN - No files will be downloaded]")
     
-    total_downloaded = 0
+    # Queue every genre first so packs from all of them share one pool
+    manifest = Manifest(SAMPLES_DIR / MANIFEST_NAME)
+    tasks = []
     total_skipped = 0
     
     for genre in genres:
-        downloaded, skipped = download_genre(genre, args.dry)
-        total_downloaded += downloaded
+        genre_tasks, skipped = queue_genre(genre, manifest, args.dry)
+        tasks.extend(genre_tasks)
         total_skipped += skipped
     
+    total_downloaded = 0
+    if tasks:
+        print(f"\nDownloading {len(tasks)} packs ({args.jobs} at a time)...")
+        total_downloaded = download_all(tasks, manifest, args.jobs)
+    
     print(f"\n{'=' * 60}")
     print(f"  COMPLETE")
     print(f"  Downloaded: {total_downloaded}")
@@ -14,78 +14,188 @@ Usage:
     python generate_wavetables.py [output_dir]
     
 Default output: data/audio/wavetables/
+
+Requires NumPy (pip install numpy).
+Optional: pip install numba to JIT-compile the additive and noise synthesis
+kernels and spread them across all CPU cores.
 """
 
 import os
 import sys
 import wave
-import struct
 import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # Constants matching ZicBox expectations
 WAVEFORMS_PER_TABLE = 64
 SAMPLES_PER_WAVEFORM = 2048
 SAMPLE_RATE = 48000
 
+# Tables, banks and sample buffers are stored in single precision: plenty
+# for 16-bit output, and half the memory traffic of float64. Phases and
+# trig arguments stay in double precision.
+SAMPLE_DTYPE = np.float32
+
+TWO_PI = 2 * math.pi
+
+# Phase of every sample in one single-cycle waveform, 0 <= phase < 1
+PHASE = np.arange(SAMPLES_PER_WAVEFORM) / SAMPLES_PER_WAVEFORM
+
+# Harmonic numbers and weights of the band-limited basic shapes
+SAW_HARMONICS = np.arange(1, 32)
+SAW_WEIGHTS = (-1.0) ** (SAW_HARMONICS + 1) / SAW_HARMONICS
+SQUARE_HARMONICS = np.arange(1, 32, 2)  # Odd harmonics only for square
+SQUARE_WEIGHTS = 1.0 / SQUARE_HARMONICS
+TRIANGLE_HARMONICS = 2 * np.arange(1, 16) - 1
+TRIANGLE_WEIGHTS = (-1.0) ** np.arange(0, 15) / (TRIANGLE_HARMONICS ** 2)
+
+# HARMONIC_BASIS[k, j] = sin(2*pi*k*PHASE[j]) for harmonics 0..63, computed once
+# and shared by every generator. A waveform built from integer harmonics is then
+# a coefficient vector @ basis, and a whole table of them a single matrix product.
+# HARMONIC_COSINES holds the matching cosines for partials with a phase offset.
+# (np.fft.irfft of the same spectrum gives the same table, but with this few
+# harmonics the plain matrix product is about twice as fast.)
+NUM_HARMONICS = 64
+HARMONIC_ANGLES = np.multiply.outer(np.arange(NUM_HARMONICS), TWO_PI * PHASE)
+HARMONIC_BASIS = np.sin(HARMONIC_ANGLES).astype(SAMPLE_DTYPE)
+HARMONIC_COSINES = np.cos(HARMONIC_ANGLES).astype(SAMPLE_DTYPE)
+del HARMONIC_ANGLES
+
+def harmonic_coeffs(harmonics, weights, gain=1.0):
+    """Coefficient vector over HARMONIC_BASIS with weights at the given harmonics"""
+    coeffs = np.zeros(NUM_HARMONICS, dtype=SAMPLE_DTYPE)
+    coeffs[harmonics] = np.asarray(weights) * gain
+    return coeffs
+
+SINE_COEFFS = harmonic_coeffs([1], [1.0])
+SAW_COEFFS = harmonic_coeffs(SAW_HARMONICS, SAW_WEIGHTS, 0.5)
+SQUARE_COEFFS = harmonic_coeffs(SQUARE_HARMONICS, SQUARE_WEIGHTS, 0.6)
+TRIANGLE_COEFFS = harmonic_coeffs(TRIANGLE_HARMONICS, TRIANGLE_WEIGHTS, 0.8)
+
+# One cycle of each basic shape, rendered once for every generator that
+# starts from an unmodified shape
+SINE_WAVE = SINE_COEFFS @ HARMONIC_BASIS
+SAW_WAVE = SAW_COEFFS @ HARMONIC_BASIS
+SQUARE_WAVE = SQUARE_COEFFS @ HARMONIC_BASIS
+TRIANGLE_WAVE = TRIANGLE_COEFFS @ HARMONIC_BASIS
+
+# Drawbar pitches relative to the fundamental (16', 5 1/3', 8', 4', 2 2/3',
+# 2', 1 3/5', 1 1/3', 1') and their sine rows; the sub and fifth drawbars are
+# not integer harmonics, so they get their own basis instead of HARMONIC_BASIS
+ORGAN_RATIOS = np.array([0.5, 1.5, 1, 2, 3, 4, 5, 6, 8])
+ORGAN_BASIS = np.sin(np.multiply.outer(ORGAN_RATIOS, TWO_PI * PHASE)).astype(SAMPLE_DTYPE)
+
 def normalize(samples):
-    """Normalize samples to [-1, 1] range"""
-    max_val = max(abs(min(samples)), abs(max(samples)))
-    if max_val > 0:
-        return [s / max_val for s in samples]
-    return samples
+    """Normalize samples to [-1, 1] range
+
+    A 2D table is normalized row by row, each waveform to its own peak.
+    """
+    samples = np.asarray(samples, dtype=SAMPLE_DTYPE)
+    max_val = np.abs(samples).max(axis=-1, keepdims=True)
+    return samples / np.where(max_val > 0, max_val, 1.0)
 
 def save_wavetable(filename, all_waveforms):
-    """Save wavetable as 32-bit float WAV file"""
-    # Flatten all waveforms into single buffer
-    samples = []
-    for waveform in all_waveforms:
-        samples.extend(waveform)
+    """Save wavetable as 16-bit PCM WAV file"""
+    # Copy the waveforms into one preallocated buffer, a row per waveform
+    samples = np.empty((len(all_waveforms), SAMPLES_PER_WAVEFORM), dtype=SAMPLE_DTYPE)
+    for i, waveform in enumerate(all_waveforms):
+        samples[i] = waveform
     
     # Convert to 16-bit PCM (ZicBox reads float but 16-bit is more compatible)
+    np.clip(samples, -1.0, 1.0, out=samples)
+    samples *= 32767
+    pcm = samples.astype('<i2')
+    
     with wave.open(filename, 'w') as wav:
         wav.setnchannels(1)
         wav.setsampwidth(2)  # 16-bit
         wav.setframerate(SAMPLE_RATE)
-        
-        for sample in samples:
-            # Clamp and convert to 16-bit
-            clamped = max(-1.0, min(1.0, sample))
-            packed = struct.pack('<h', int(clamped * 32767))
-            wav.writeframesraw(packed)
+        wav.writeframesraw(pcm.tobytes())
     
     print(f"  Created: {filename}")
 
+if njit is not None:
+    # Compiled lazily on first call, which with cache=True is a load from
+    # __pycache__ after the first run. An explicit signature would compile
+    # eagerly instead, but that starts Numba's thread pool at import, and
+    # the forked workers in main() then leave the parent hung at exit.
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _additive_kernel(phase, harmonics, weights):
+        """Compiled additive(): one fused loop per sample, samples in parallel"""
+        out = np.empty(phase.size, dtype=np.float32)
+        for j in prange(phase.size):
+            angle = TWO_PI * phase[j]
+            total = 0.0
+            for k in range(harmonics.size):
+                total += weights[k] * math.sin(harmonics[k] * angle)
+            out[j] = total
+        return out
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _noise_kernel(phase, draws, noise_amount):
+        """Compiled noise harmonics for generate_noise_shapes(); draws[j, h - 1]
+        holds the random (amplitude, phase offset) pair of harmonic h at sample j"""
+        out = np.empty(phase.size, dtype=np.float32)
+        offset_scale = TWO_PI * noise_amount
+        for j in prange(phase.size):
+            angle = TWO_PI * phase[j]
+            noise = 0.0
+            for k in range(draws.shape[1]):
+                h = k + 1
+                amp = draws[j, k, 0] * noise_amount / h
+                phase_offset = draws[j, k, 1] * offset_scale
+                noise += amp * math.sin(h * angle + phase_offset)
+            out[j] = noise
+        return out
+
+def additive(phase, harmonics, weights):
+    """Weighted sum of sin(2*pi*h*phase) over all harmonics h at once.
+
+    phase may be a scalar or an array of any shape; the harmonics are
+    broadcast along a new leading axis and summed away.
+    """
+    if njit is not None:
+        phase = np.asarray(phase, dtype=np.float64)
+        out = _additive_kernel(
+            phase.ravel(),
+            np.asarray(harmonics, dtype=np.float64),
+            np.asarray(weights, dtype=np.float64),
+        )
+        return out.reshape(phase.shape)
+    
+    # Scale the phases by 2*pi once, before they are broadcast over the harmonics
+    partials = np.sin(np.multiply.outer(harmonics, TWO_PI * np.asarray(phase)))
+    return np.tensordot(weights, partials, axes=1)
+
 def generate_sine(phase):
     """Generate sine wave"""
-    return math.sin(2 * math.pi * phase)
+    return np.sin(TWO_PI * phase)
 
 def generate_saw(phase):
     """Generate sawtooth wave (band-limited approximation)"""
     # Use additive synthesis for band-limiting
-    result = 0
-    for k in range(1, 32):
-        result += ((-1) ** (k+1)) * math.sin(2 * math.pi * k * phase) / k
-    return result * 0.5
+    return additive(phase, SAW_HARMONICS, SAW_WEIGHTS) * 0.5
 
 def generate_square(phase, duty=0.5):
     """Generate square/pulse wave (band-limited)"""
-    result = 0
-    for k in range(1, 32, 2):  # Odd harmonics only for square
-        result += math.sin(2 * math.pi * k * phase) / k
-    return result * 0.6
+    return additive(phase, SQUARE_HARMONICS, SQUARE_WEIGHTS) * 0.6
 
 def generate_triangle(phase):
     """Generate triangle wave (band-limited)"""
-    result = 0
-    for k in range(1, 16):
-        n = 2 * k - 1
-        result += ((-1) ** (k+1)) * math.sin(2 * math.pi * n * phase) / (n * n)
-    return result * 0.8
+    return additive(phase, TRIANGLE_HARMONICS, TRIANGLE_WEIGHTS) * 0.8
 
 def generate_pulse(phase, width):
     """Generate pulse wave with variable width"""
-    return 1.0 if (phase % 1.0) < width else -1.0
+    # Arithmetic on the comparison mask keeps this branch-free over arrays
+    return 2.0 * (np.mod(phase, 1.0) < width) - 1.0
 
 def lerp(a, b, t):
     """Linear interpolation"""
@@ -102,38 +212,16 @@ def generate_basic_shapes():
     Great for learning and basic synthesis
     """
     print("Generating: Basic_Shapes.wav")
-    waveforms = []
     
-    for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
-        t = i / (WAVEFORMS_PER_TABLE - 1)  # 0 to 1
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            
-            # 4-way morph: sine→tri→saw→square
-            if t < 0.25:
-                # Sine to Triangle
-                mix = t * 4
-                sample = lerp(generate_sine(phase), generate_triangle(phase), mix)
-            elif t < 0.5:
-                # Triangle to Saw
-                mix = (t - 0.25) * 4
-                sample = lerp(generate_triangle(phase), generate_saw(phase), mix)
-            elif t < 0.75:
-                # Saw to Square
-                mix = (t - 0.5) * 4
-                sample = lerp(generate_saw(phase), generate_square(phase), mix)
-            else:
-                # Square back to Sine
-                mix = (t - 0.75) * 4
-                sample = lerp(generate_square(phase), generate_sine(phase), mix)
-            
-            waveform.append(sample)
-        
-        waveforms.append(normalize(waveform))
+    # 4-way morph: sine→tri→saw→square→sine. Each waveform picks its
+    # segment by index and blends that segment's two end shapes.
+    shapes = np.stack([SINE_WAVE, TRIANGLE_WAVE, SAW_WAVE, SQUARE_WAVE, SINE_WAVE])
     
-    return waveforms
+    t = np.arange(WAVEFORMS_PER_TABLE) / (WAVEFORMS_PER_TABLE - 1)  # 0 to 1
+    segment = np.minimum((t * 4).astype(int), len(shapes) - 2)
+    mix = (t * 4 - segment)[:, None]
+    
+    return normalize(lerp(shapes[segment], shapes[segment + 1], mix))
 
 def generate_harmonic_series():
     """
@@ -142,27 +230,17 @@ def generate_harmonic_series():
     Perfect for pads and evolving textures
     """
     print("Generating: Harmonic_Series.wav")
-    waveforms = []
     
-    for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
-        # Number of harmonics increases with index
-        num_harmonics = 1 + int(i * 31 / (WAVEFORMS_PER_TABLE - 1))
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            sample = 0
-            
-            for h in range(1, num_harmonics + 1):
-                # Amplitude decreases with harmonic number
-                amp = 1.0 / h
-                sample += amp * math.sin(2 * math.pi * h * phase)
-            
-            waveform.append(sample)
-        
-        waveforms.append(normalize(waveform))
+    # Number of harmonics increases with index
+    index = np.arange(WAVEFORMS_PER_TABLE)
+    num_harmonics = 1 + (index * 31 / (WAVEFORMS_PER_TABLE - 1)).astype(int)
     
-    return waveforms
+    # Amplitude decreases with harmonic number, one row per waveform
+    h = np.arange(1, 33)
+    coeffs = np.zeros((WAVEFORMS_PER_TABLE, NUM_HARMONICS), dtype=SAMPLE_DTYPE)
+    coeffs[:, h] = np.where(h <= num_harmonics[:, None], 1.0 / h, 0.0)
+    
+    return normalize(coeffs @ HARMONIC_BASIS)
 
 def generate_fm_bells():
     """
@@ -171,27 +249,28 @@ def generate_fm_bells():
     Inspired by DX7 bell patches
     """
     print("Generating: FM_Bells.wav")
-    waveforms = []
+    waveforms = np.empty((WAVEFORMS_PER_TABLE, SAMPLES_PER_WAVEFORM), dtype=SAMPLE_DTYPE)
+    
+    # FM ratio for bell-like tones (carrier:modulator)
+    ratio = 3.5  # Classic bell ratio
+    
+    # The modulator is the same for every waveform, only its depth changes
+    base = TWO_PI * PHASE
+    modulator = np.sin(base * ratio)
+    
+    # Carrier phase, reused by every waveform; the sine goes straight into the table
+    carrier_phase = np.empty_like(base)
     
     for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
         # Modulation index increases with table position
         mod_index = i * 8.0 / (WAVEFORMS_PER_TABLE - 1)
-        # FM ratio for bell-like tones (carrier:modulator)
-        ratio = 3.5  # Classic bell ratio
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            
-            # 2-operator FM: carrier modulated by modulator
-            modulator = math.sin(2 * math.pi * ratio * phase)
-            carrier = math.sin(2 * math.pi * phase + mod_index * modulator)
-            
-            waveform.append(carrier)
         
-        waveforms.append(normalize(waveform))
+        # 2-operator FM: carrier modulated by modulator
+        np.multiply(modulator, mod_index, out=carrier_phase)
+        carrier_phase += base
+        np.sin(carrier_phase, out=waveforms[i])
     
-    return waveforms
+    return normalize(waveforms)
 
 def generate_pwm_sweep():
     """
@@ -200,28 +279,16 @@ def generate_pwm_sweep():
     Classic analog synth sound
     """
     print("Generating: PWM_Sweep.wav")
-    waveforms = []
     
-    for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
-        # Duty cycle from 50% down to 5%
-        duty = 0.5 - (i * 0.45 / (WAVEFORMS_PER_TABLE - 1))
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            
-            # Band-limited pulse using additive synthesis
-            sample = 0
-            for k in range(1, 32):
-                # Pulse wave Fourier series
-                coef = math.sin(math.pi * k * duty) / k
-                sample += coef * math.sin(2 * math.pi * k * phase)
-            
-            waveform.append(sample)
-        
-        waveforms.append(normalize(waveform))
+    # Duty cycle from 50% down to 5%
+    duty = 0.5 - (np.arange(WAVEFORMS_PER_TABLE) * 0.45 / (WAVEFORMS_PER_TABLE - 1))
     
-    return waveforms
+    # Band-limited pulse using additive synthesis: pulse wave Fourier series
+    k = np.arange(1, 32)
+    coeffs = np.zeros((WAVEFORMS_PER_TABLE, NUM_HARMONICS), dtype=SAMPLE_DTYPE)
+    coeffs[:, k] = np.sin(np.pi * np.outer(duty, k)) / k
+    
+    return normalize(coeffs @ HARMONIC_BASIS)
 
 def generate_sync_sweep():
     """
@@ -230,25 +297,15 @@ def generate_sync_sweep():
     Creates aggressive, cutting tones
     """
     print("Generating: Sync_Sweep.wav")
-    waveforms = []
     
-    for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
-        # Sync ratio from 1:1 to 1:8
-        sync_ratio = 1.0 + (i * 7.0 / (WAVEFORMS_PER_TABLE - 1))
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            
-            # Hard sync: slave resets when master completes cycle
-            slave_phase = (phase * sync_ratio) % 1.0
-            sample = generate_saw(slave_phase)
-            
-            waveform.append(sample)
-        
-        waveforms.append(normalize(waveform))
+    # Sync ratio from 1:1 to 1:8
+    sync_ratio = 1.0 + (np.arange(WAVEFORMS_PER_TABLE) * 7.0 / (WAVEFORMS_PER_TABLE - 1))
     
-    return waveforms
+    # Hard sync: slave resets when master completes cycle. One row of slave
+    # phases per waveform, so the whole table is a single additive() call.
+    slave_phase = np.mod(np.multiply.outer(sync_ratio, PHASE), 1.0)
+    
+    return normalize(generate_saw(slave_phase))
 
 def generate_formant_vowels():
     """
@@ -269,11 +326,12 @@ def generate_formant_vowels():
     }
     
     vowel_order = ['A', 'E', 'I', 'O', 'U', 'A']  # Loop back
-    waveforms = []
     
+    base_freq = 100  # Fundamental frequency reference
+    offsets = np.arange(-2, 3)  # Harmonics around each formant peak
+    
+    coeffs = np.zeros((WAVEFORMS_PER_TABLE, NUM_HARMONICS), dtype=SAMPLE_DTYPE)
     for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
-        
         # Determine which vowels to blend
         segment = i / (WAVEFORMS_PER_TABLE - 1) * (len(vowel_order) - 1)
         idx = int(segment)
@@ -287,33 +345,21 @@ def generate_formant_vowels():
         v2 = vowels[vowel_order[idx + 1]]
         
         # Interpolate formants
-        formants = []
-        for f1, f2 in zip(v1, v2):
-            freq = lerp(f1[0], f2[0], blend)
-            amp = lerp(f1[1], f2[1], blend)
-            formants.append((freq, amp))
+        ratios = np.empty(len(v1))
+        amps = np.empty(len(v1))
+        for f, (f1, f2) in enumerate(zip(v1, v2)):
+            ratios[f] = lerp(f1[0], f2[0], blend) / base_freq
+            amps[f] = lerp(f1[1], f2[1], blend)
         
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            sample = 0
-            
-            # Generate formant peaks
-            base_freq = 100  # Fundamental frequency reference
-            for freq, amp in formants:
-                ratio = freq / base_freq
-                # Create resonant peak using multiple harmonics
-                for h in range(-2, 3):
-                    harmonic = int(ratio) + h
-                    if harmonic > 0:
-                        distance = abs(ratio - harmonic)
-                        peak_amp = amp * math.exp(-distance * 2)
-                        sample += peak_amp * math.sin(2 * math.pi * harmonic * phase) / harmonic
-            
-            waveform.append(sample)
-        
-        waveforms.append(normalize(waveform))
-    
-    return waveforms
+        # Generate formant peaks: a resonant peak from the harmonics around
+        # each formant ratio, weighted by their distance from it
+        harmonic = ratios.astype(int)[:, None] + offsets
+        peak_amp = amps[:, None] * np.exp(-np.abs(ratios[:, None] - harmonic) * 2)
+        valid = harmonic > 0
+        # Neighbouring formants can share harmonics, so accumulate
+        np.add.at(coeffs[i], harmonic[valid], peak_amp[valid] / harmonic[valid])
+    
+    return normalize(coeffs @ HARMONIC_BASIS)
 
 def generate_supersaw():
     """
@@ -322,30 +368,24 @@ def generate_supersaw():
     Classic trance/EDM lead sound (JP-8000 style)
     """
     print("Generating: SuperSaw.wav")
-    waveforms = []
+    waveforms = np.empty((WAVEFORMS_PER_TABLE, SAMPLES_PER_WAVEFORM), dtype=SAMPLE_DTYPE)
+    
+    # Voice phases, one row per voice, reused by every waveform
+    max_voices = 7
+    voice_phase = np.empty((max_voices, SAMPLES_PER_WAVEFORM))
     
     for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
         # Detune amount increases with index
         detune = i * 0.03 / (WAVEFORMS_PER_TABLE - 1)  # Up to 3% detune
-        num_voices = 1 + int(i * 6 / (WAVEFORMS_PER_TABLE - 1))  # 1 to 7 voices
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            sample = 0
-            
-            for v in range(num_voices):
-                # Spread voices around center
-                voice_detune = (v - (num_voices - 1) / 2) * detune
-                voice_phase = phase * (1 + voice_detune)
-                sample += generate_saw(voice_phase)
-            
-            sample /= num_voices
-            waveform.append(sample)
+        num_voices = 1 + int(i * (max_voices - 1) / (WAVEFORMS_PER_TABLE - 1))  # 1 to 7 voices
         
-        waveforms.append(normalize(waveform))
+        # Spread voices around center
+        voice_detune = (np.arange(num_voices) - (num_voices - 1) / 2) * detune
+        phases = voice_phase[:num_voices]
+        np.multiply.outer(1 + voice_detune, PHASE, out=phases)
+        np.mean(generate_saw(phases), axis=0, out=waveforms[i])
     
-    return waveforms
+    return normalize(waveforms)
 
 def generate_noise_shapes():
     """
@@ -359,28 +399,34 @@ def generate_noise_shapes():
     import random
     random.seed(42)  # Reproducible noise
     
+    # NumPy's legacy generator is the same Mersenne Twister as random, so
+    # starting it from random's seeded state yields the exact same stream
+    # of doubles, drawn a whole array at a time
+    _, mt_state, _ = random.getstate()
+    rng = np.random.RandomState()
+    rng.set_state(('MT19937', np.array(mt_state[:-1], dtype=np.uint32), mt_state[-1]))
+    
+    h = np.arange(1, 64)
+    # Noise harmonic rows; sample j of harmonic h is sin_h[h - 1, j] etc.
+    sin_h, cos_h = HARMONIC_BASIS[h], HARMONIC_COSINES[h]
+    
     for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
         noise_amount = i / (WAVEFORMS_PER_TABLE - 1)
         
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            
-            # Base saw wave
-            base = generate_saw(phase)
-            
-            # Add noise harmonics
-            noise = 0
-            for h in range(1, 64):
-                # Random amplitude and slight phase offset
-                amp = random.random() * noise_amount / h
-                phase_offset = random.random() * 2 * math.pi * noise_amount
-                noise += amp * math.sin(2 * math.pi * h * phase + phase_offset)
+        # Random amplitude and slight phase offset for every harmonic of every
+        # sample, drawn in the same order as a per-sample loop would
+        draws = rng.random_sample((SAMPLES_PER_WAVEFORM, len(h), 2))
+        
+        if njit is not None:
+            noise = _noise_kernel(PHASE, draws, noise_amount)
+        else:
+            amp = draws[:, :, 0].T * noise_amount / h[:, None]
+            phase_offset = draws[:, :, 1].T * (TWO_PI * noise_amount)
             
-            sample = base * (1 - noise_amount * 0.5) + noise
-            waveform.append(sample)
+            # Add noise harmonics: sin(a + b) = sin(a)cos(b) + cos(a)sin(b)
+            noise = (amp * (sin_h * np.cos(phase_offset) + cos_h * np.sin(phase_offset))).sum(axis=0)
         
-        waveforms.append(normalize(waveform))
+        waveforms.append(normalize(SAW_WAVE * (1 - noise_amount * 0.5) + noise))
     
     return waveforms
 
@@ -405,14 +451,12 @@ def generate_organ():
         [0, 8, 8, 0, 8, 0, 0, 0, 0],  # Smooth
     ]
     
-    # Drawbar harmonics (16', 5 1/3', 8', 4', 2 2/3', 2', 1 3/5', 1 1/3', 1')
-    harmonic_ratios = [0.5, 1.5, 1, 2, 3, 4, 5, 6, 8]
-    
-    waveforms = []
+    # The waveform is linear in the drawbar values, so render each
+    # registration once (drawbars normalized to 0-1) and blend the results
+    endpoints = (np.array(registrations, dtype=SAMPLE_DTYPE) / 8.0) @ ORGAN_BASIS
     
+    waveforms = np.empty((WAVEFORMS_PER_TABLE, SAMPLES_PER_WAVEFORM), dtype=SAMPLE_DTYPE)
     for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
-        
         # Interpolate between registrations
         segment = i / (WAVEFORMS_PER_TABLE - 1) * (len(registrations) - 1)
         idx = int(segment)
@@ -422,25 +466,10 @@ def generate_organ():
             idx = len(registrations) - 2
             blend = 1.0
         
-        # Blend drawbar values
-        drawbars = []
-        for d in range(9):
-            val = lerp(registrations[idx][d], registrations[idx + 1][d], blend)
-            drawbars.append(val / 8.0)  # Normalize to 0-1
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            sample = 0
-            
-            for d, (ratio, amp) in enumerate(zip(harmonic_ratios, drawbars)):
-                if amp > 0:
-                    sample += amp * math.sin(2 * math.pi * ratio * phase)
-            
-            waveform.append(sample)
-        
-        waveforms.append(normalize(waveform))
+        # Blend drawbar registrations
+        waveforms[i] = lerp(endpoints[idx], endpoints[idx + 1], blend)
     
-    return waveforms
+    return normalize(waveforms)
 
 def generate_acid():
     """
@@ -449,42 +478,32 @@ def generate_acid():
     Essential for acid house/techno
     """
     print("Generating: Acid.wav")
-    waveforms = []
     
-    for i in range(WAVEFORMS_PER_TABLE):
-        waveform = []
-        # Simulate filter resonance by boosting harmonics near cutoff
-        resonance = i / (WAVEFORMS_PER_TABLE - 1)
-        cutoff_harmonic = 4 + int(resonance * 12)  # Cutoff sweeps up
-        
-        for j in range(SAMPLES_PER_WAVEFORM):
-            phase = j / SAMPLES_PER_WAVEFORM
-            sample = 0
-            
-            for h in range(1, 32):
-                base_amp = 1.0 / h
-                
-                # Resonance peak near cutoff
-                distance = abs(h - cutoff_harmonic)
-                if distance < 3:
-                    resonance_boost = 1.0 + resonance * 4 * math.exp(-distance)
-                else:
-                    resonance_boost = 1.0
-                
-                # Simple lowpass rolloff
-                if h > cutoff_harmonic:
-                    rolloff = math.exp(-(h - cutoff_harmonic) * 0.5)
-                else:
-                    rolloff = 1.0
-                
-                amp = base_amp * resonance_boost * rolloff
-                sample += amp * math.sin(2 * math.pi * h * phase)
-            
-            waveform.append(sample)
-        
-        waveforms.append(normalize(waveform))
+    h = np.arange(1, 32)
+    base_amp = 1.0 / h
     
-    return waveforms
+    # Simulate filter resonance by boosting harmonics near cutoff; one row
+    # per waveform, one column per harmonic
+    resonance = (np.arange(WAVEFORMS_PER_TABLE) / (WAVEFORMS_PER_TABLE - 1))[:, None]
+    cutoff_harmonic = 4 + (resonance * 12).astype(int)  # Cutoff sweeps up
+    
+    # Resonance peak near cutoff
+    distance = np.abs(h - cutoff_harmonic)
+    resonance_boost = np.where(distance < 3, 1.0 + resonance * 4 * np.exp(-distance), 1.0)
+    
+    # Simple lowpass rolloff
+    rolloff = np.where(h > cutoff_harmonic, np.exp(-(h - cutoff_harmonic) * 0.5), 1.0)
+    
+    coeffs = np.zeros((WAVEFORMS_PER_TABLE, NUM_HARMONICS), dtype=SAMPLE_DTYPE)
+    coeffs[:, h] = base_amp * resonance_boost * rolloff
+    
+    return normalize(coeffs @ HARMONIC_BASIS)
+
+def generate_file(name, generator, output_dir):
+    """Generate one wavetable and save it as output_dir/<name>.wav"""
+    waveforms = generator()
+    filename = output_dir / f"{name}.wav"
+    save_wavetable(str(filename), waveforms)
 
 def main():
     # Determine output directory
@@ -516,10 +535,14 @@ def main():
         ("Acid", generate_acid),
     ]
     
-    for name, generator in generators:
-        waveforms = generator()
-        filename = output_dir / f"{name}.wav"
-        save_wavetable(str(filename), waveforms)
+    # The tables are independent of each other, so each is built in its own process
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(generate_file, name, generator, output_dir)
+            for name, generator in generators
+        ]
+        for future in as_completed(futures):
+            future.result()
     
     print("-" * 50)
     print(f"Generated {len(generators)} wavetable files.")